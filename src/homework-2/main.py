@@ -1,8 +1,36 @@
 # I ran this script using `uv run main.py`, and to install the two dependencies run `uv sync` (`uv` is a python virtual environment manager and package manager)
-# if you don't want to use `uv`, the only packages used are `pandas` and `scipy`
+# if you don't want to use `uv`, the only packages used are `pandas` and `scipy` (`numpy` comes along with `pandas`)
 
+from concurrent.futures import ThreadPoolExecutor  # used to read files in parallel
+from itertools import islice  # used to read the actigraph headers
+
+import numpy as np  # used for the vectorized math
 import pandas as pd  # used to parse .csv's
-from scipy import stats  # used for p-value calculations
+from scipy.special import fdtrc, stdtr  # used for p-value calculations
+
+
+# small numeric kernels shared by the statistics functions below
+# they all expect a flat, contiguous float64 array so that numpy does the looping in C
+def _std(arr):
+    """
+    population standard deviation of a float array
+    """
+    return (_ss_from_mean(arr, arr.mean()) / arr.size) ** 0.5
+
+
+def _harmonic(arr):
+    """
+    harmonic mean of a float array with no zeros in it
+    """
+    return arr.size / np.reciprocal(arr).sum()
+
+
+def _ss_from_mean(arr, mean):
+    """
+    sum of the squared differences between a float array and a mean
+    """
+    diff = arr - mean
+    return np.dot(diff, diff)  # squares and sums in the same pass
 
 
 def calculate_mean(data, use_harmonic=False):
@@ -11,9 +39,9 @@ def calculate_mean(data, use_harmonic=False):
     defaults to arithmetic mean, but can be overwritten by passing `use_harmonic=True`
     returns either a mean or a list of means
     """
-    # if the data is a pandas object, convert it to a list
+    # if the data is a pandas object, convert it to a float array
     if isinstance(data, (pd.DataFrame, pd.Series)):
-        data = data.tolist()
+        data = data.to_numpy(dtype=np.float64)
 
     # check if data is a list of lists, and not a pandas series or dataframe
     if isinstance(data, list) and data and isinstance(data[0], list):
@@ -25,43 +53,50 @@ def calculate_mean(data, use_harmonic=False):
             )  # pass through `use_hamonic` to preserve the original state
         return results
 
-    # from here, `data` is a single list
-    n = len(data)
-    if n == 0:
-        return 0
-
+    # from here, `data` is a single dataset
     if use_harmonic:
-        # calculate harmonic mean
-        total_reciprocal = 0.0
-        for x in data:
-            if x == 0:
-                return 0.0  # harmonic mean is 0 if any element is 0
-            total_reciprocal += 1.0 / x
-
-        return n / total_reciprocal
+        return _harmonic_mean(data)
     else:
-        # arithmetic mean
-        if n == 0:
-            return 0
-        return sum(data) / n
+        return _arithmetic_mean(data)
+
+
+def _arithmetic_mean(data):
+    """
+    arithmetic mean of a single dataset, called directly when the kind of mean is already known
+    """
+    arr = np.asarray(data, dtype=np.float64)
+    if arr.size == 0:
+        return 0
+
+    return float(arr.mean())
+
+
+def _harmonic_mean(data):
+    """
+    harmonic mean of a single dataset, called directly when the kind of mean is already known
+    """
+    arr = np.asarray(data, dtype=np.float64)
+    if arr.size == 0:
+        return 0
+
+    if (arr == 0).any():
+        return 0.0  # harmonic mean is 0 if any element is 0
+
+    return float(_harmonic(arr))
 
 
 def std_dev(data):
     """
     calculates population standard deviation from a list of data
     """
-    # if the data is a pandas object, convert it to a list
-    if isinstance(data, (pd.DataFrame, pd.Series)):
-        data = data.values.flatten().tolist()
+    # convert the data (list or pandas object) into one flat float array, so numpy does the looping
+    arr = np.ascontiguousarray(data, dtype=np.float64).ravel()
 
-    n = len(data)  # sanity check on data
-    if n == 0:
+    if arr.size == 0:  # sanity check on data
         return 0
 
-    mean = sum(data) / n
-    # using equation from 'homework-2.pdf', split into 2 lines
-    sq_diff = sum((x - mean) ** 2 for x in data)
-    return (sq_diff / n) ** 0.5
+    # using equation from 'homework-2.pdf'
+    return float(_std(arr))
 
 
 def pooled_std_dev(data_pairs):
@@ -87,23 +122,44 @@ def pooled_std_dev(data_pairs):
     return (numerator / denominator) ** 0.5  # take final square root
 
 
+def pooled_variance_from_ss(data_pairs):
+    """
+    calculates the pooled variance from a list of (sum of squares, n) pairings, as sum(SS_i) / sum(n_i - 1)
+    unlike squaring pooled_std_dev() on the population sigmas from std_dev(), this pools the actual sums of squares, so it is not off by a factor of n / (n - 1) (and no square roots need to be taken and undone)
+    """
+    k = len(data_pairs)  # sanity check on data
+    if k < 2:
+        return "error: need at least two pairings to pool"
+
+    # split equation from 'homework-2.pdf' into numerator and denominator
+    numerator = sum(ss for ss, _ in data_pairs)
+    denominator = sum(n - 1 for _, n in data_pairs)
+
+    if denominator == 0:
+        return 0
+
+    return numerator / denominator
+
+
 def t_test(data1, data2, use_harmonic=False):
     """
     performs t-test between two sets of data, and returns the t- and p-test from two inputted lists
     when calculating mu, there is an option to use harmonic mean over the arithmetic mean (defaults to arithmetic), but from what I understand there would never be a reason to do this
     """
     params = []
+    # pick the kind of mean once, instead of every time it's used
+    mean = _harmonic_mean if use_harmonic else _arithmetic_mean
 
     # handle whether the inputs are datasets with needed parameters, or if they need to be calculated first
     for data in [data1, data2]:
-        # if the data is a pandas object, convert it to a list
+        # if the data is a pandas object, convert it to a float array
         if isinstance(data, (pd.DataFrame, pd.Series)):
-            data = data.tolist()
+            data = data.to_numpy(dtype=np.float64)
 
         if isinstance(data, (list, tuple)) and not isinstance(data[0], (int, float)):
             params.append(data)
         else:
-            mu = calculate_mean(data, use_harmonic)
+            mu = mean(data)
             sigma = std_dev(data)
             n = len(data)
             params.append((mu, sigma, n))
@@ -113,15 +169,16 @@ def t_test(data1, data2, use_harmonic=False):
 
     # using the equation from 'homework-2.pdf', split up the t-test into three steps
     # 1. calculate the pooled standard deviation
+    # this intentionally stays on pooled_std_dev(), since t_test() also accepts precomputed (mu, sigma, n) summaries and only has sigma to pool for those, so both input forms give the same answer
     sigma_p = pooled_std_dev([(sigma1, n1), (sigma2, n2)])
     # 2. calculate standard error
     standard_error = sigma_p * ((1 / n1 + 1 / n2) ** 0.5)
     # 3. combine into final t-value
     t_value = (mu1 - mu2) / standard_error
 
-    # use t-value to calculate p-value using scipy
+    # use t-value to calculate p-value using scipy (calling the t-distribution function directly skips the `stats.t` wrapper overhead)
     degees_freedom = n1 + n2 - 2
-    p_value = 2 * (1 - stats.t.cdf(abs(t_value), degees_freedom))
+    p_value = 2 * stdtr(degees_freedom, -abs(t_value))
 
     return t_value, p_value
 
@@ -139,23 +196,24 @@ def anova(datasets):
         return "error: anova requires at least 3 datasets"
 
     # I followed the equations from 'homework-2.pdf' and did some more research online, so I believe that I set up the anova equations correctly
-    # flatten datasets into one list
-    all_observations = [item for sublist in datasets for item in sublist]
-    N = len(all_observations)
-    overall_mean = calculate_mean(all_observations)
-
-    # calculate the sum of squares total
-    sum_squares_total = sum((x - overall_mean) ** 2 for x in all_observations)
+    # convert each group into its own float array, instead of flattening everything into one list
+    groups = [np.ascontiguousarray(data, dtype=np.float64) for data in datasets]
+    group_sizes = np.array([group.size for group in groups])
+    group_means = np.array(
+        [group.mean() if group.size else 0.0 for group in groups]
+    )  # an empty group has no mean, so give it 0 (it has no weight in the sums below anyway)
+    N = group_sizes.sum()
+    # the overall mean is the weighted mean of the group means
+    overall_mean = (group_sizes @ group_means) / N
 
     # calculate the sum of squares between
-    sum_squares_between = 0
-    for data in datasets:
-        n_j = len(data)
-        group_mean = calculate_mean(data)
-        sum_squares_between += n_j * (group_mean - overall_mean) ** 2
+    sum_squares_between = (group_sizes * (group_means - overall_mean) ** 2).sum()
 
-    # calculate the sume of squares within
-    sum_squares_within = sum_squares_total - sum_squares_between
+    # calculate the sum of squares within directly from each group, since total = between + within there is no need for a pass over every observation
+    sum_squares_within = sum(
+        _ss_from_mean(group, group_mean)
+        for group, group_mean in zip(groups, group_means)
+    )
 
     degrees_freedom_between = m - 1
     degrees_freedom_within = N - m
@@ -166,7 +224,7 @@ def anova(datasets):
 
     # calculate the f-stat and p-value
     f_stat = mean_squares_between / mean_squares_within
-    p_value = 1 - stats.f.cdf(f_stat, degrees_freedom_between, degrees_freedom_within)
+    p_value = fdtrc(degrees_freedom_between, degrees_freedom_within, f_stat)
 
     return f_stat, p_value
 
@@ -175,35 +233,28 @@ def rmanova(datasets):
     """
     calculates the rmanova f-stat and p-value from an inputted dataset (list of lists)
     """
-    # if the data is a pandas object, convert it to a list of lists
+    # convert the rows into one 2-d float array, so the row and column reductions happen in numpy
     if isinstance(datasets, pd.DataFrame):
+        # if the data is a pandas object, use its values directly (no need to go through a list of lists)
         # handle any null values so that rmanova() is happy
-        if datasets.isnull().values.any():
-            datasets.fillna(0, inplace=True)
-        datasets = datasets.values.tolist()
-
-    num_rows = len(datasets)
-    num_columns = len(datasets[0])
+        arr = datasets.fillna(0).to_numpy(dtype=np.float64)
+    else:
+        arr = np.asarray(datasets, dtype=np.float64)
+    num_rows, num_columns = arr.shape
 
-    all_values = [val for sub in datasets for val in sub]
-    all_values_mean = calculate_mean(all_values)
+    all_values_mean = arr.mean()
 
     # I followed the equations from 'homework-2.pdf' and did some more research online, so I believe that I set up the rmanova equations correctly
-    # calculate the sum of squares of subjects
-    sum_squares_subjects = 0
-    for data in datasets:
-        data_mean = calculate_mean(data)
-        sum_squares_subjects += num_columns * (data_mean - all_values_mean) ** 2
-
-    # calculate the sum of squares of conditions
-    sum_squares_conditions = 0
-    for column in range(num_columns):
-        column_data = [datasets[row][column] for row in range(num_rows)]
-        column_mean = calculate_mean(column_data)
-        sum_squares_conditions += num_rows * (column_mean - all_values_mean) ** 2
+    # calculate the sum of squares of subjects (rows)
+    row_means = arr.mean(axis=1)
+    sum_squares_subjects = num_columns * _ss_from_mean(row_means, all_values_mean)
+
+    # calculate the sum of squares of conditions (columns)
+    column_means = arr.mean(axis=0)
+    sum_squares_conditions = num_rows * _ss_from_mean(column_means, all_values_mean)
 
     # calculate the sum of squares total using the previously calculated values
-    sum_squares_total = sum((x - all_values_mean) ** 2 for x in all_values)
+    sum_squares_total = _ss_from_mean(arr.ravel(), all_values_mean)
     sum_squares_error = (
         sum_squares_total - sum_squares_conditions - sum_squares_subjects
     )
@@ -217,30 +268,92 @@ def rmanova(datasets):
 
     # calculate the f-stat and p-value
     f_stat = mean_squares_conditions / mean_squares_error
-    p_value = 1 - stats.f.cdf(f_stat, degrees_freedom_conditions, degrees_freedom_error)
+    p_value = fdtrc(degrees_freedom_conditions, degrees_freedom_error, f_stat)
 
     return f_stat, p_value
 
 
+def read_fitbit_steps(file_path):
+    """
+    reads one fitbit minute steps .csv and adds the parsed `ActivityHour` and `Date` columns
+    returns None if the file could not be read
+    """
+    try:
+        fb_steps_csv_daily = pd.read_csv(file_path)
+        # manually set date formatting so pandas can read them correctly (or else it fails to detect the format)
+        fb_steps_csv_daily["ActivityHour"] = pd.to_datetime(
+            fb_steps_csv_daily["ActivityHour"], format="%m/%d/%Y %I:%M:%S %p"
+        )
+        # truncate to the day with integer datetime math, instead of building a python `date` object for every row
+        fb_steps_csv_daily["Date"] = (
+            fb_steps_csv_daily["ActivityHour"].to_numpy().astype("datetime64[D]")
+        )
+        return fb_steps_csv_daily
+    except Exception as e:
+        print(f"error reading {file_path}: {e}")
+        return None
+
+
+def read_actigraph_steps(ag_file):
+    """
+    reads the steps column of one actigraph .csv, indexed by the minute each row was recorded
+    """
+    with open(ag_file, "r") as f:
+        header = list(islice(f, 10))  # remove 10 line header on the actigraph files
+
+        # text match in the header to find start time and date
+        ag_start_time_str = (
+            [line for line in header if "Start Time" in line][0].split(" ")[-1].strip()
+        )
+        ag_start_date_str = (
+            [line for line in header if "Start Date" in line][0].split(" ")[-1].strip()
+        )
+
+        ag_start_datetime = pd.to_datetime(
+            f"{ag_start_date_str} {ag_start_time_str}"
+        )  # combine the time and day into a datetime
+
+        # use pandas to read the steps data, continuing from the end of the header instead of re-opening the file
+        ag_steps = pd.read_csv(
+            f,
+            header=None,
+            usecols=[3],
+            names=["Steps"],
+        )
+
+    # format data to be merged later
+    ag_steps.index = pd.date_range(
+        start=ag_start_datetime, periods=len(ag_steps), freq="min"
+    )
+    return ag_steps
+
+
 def main():
     # reusable preprocessing for fitbit dataframes
     fitbit_participant_files = [
         f"sample-data/actigraph-and-fitbit/fitbit/{i}_FB_minuteSteps.csv"
         for i in range(1, 5)
     ]
-    fb_dataframes = []  # since I will re-use the fitbit steps data, I will also store it in a dataframe for later
-
-    for file_path in fitbit_participant_files:
-        try:
-            fb_steps_csv_daily = pd.read_csv(file_path)
-            # manually set date formatting so pandas can read them correctly (or else it fails to detect the format)
-            fb_steps_csv_daily["ActivityHour"] = pd.to_datetime(
-                fb_steps_csv_daily["ActivityHour"], format="%m/%d/%Y %I:%M:%S %p"
+    # since I will re-use the fitbit steps data, I will also store it in a dataframe for later
+    # every file is parsed independently, so read them in parallel like the actigraph files (threads, since pandas releases the GIL while parsing and nothing needs to be pickled)
+    with ThreadPoolExecutor(max_workers=len(fitbit_participant_files)) as executor:
+        fb_dataframes = [
+            fb_steps_csv_daily
+            for fb_steps_csv_daily in executor.map(
+                read_fitbit_steps, fitbit_participant_files
             )
-            fb_steps_csv_daily["Date"] = fb_steps_csv_daily["ActivityHour"].dt.date
-            fb_dataframes.append(fb_steps_csv_daily)  # store steps data for reuse
-        except Exception as e:
-            print(f"error reading {file_path}: {e}")
+            if fb_steps_csv_daily is not None  # skip any files that failed to read
+        ]
+
+    # the `.iloc` positions below only line up if every file has its columns in the same order, so put any file with a different order into the first file's order
+    if fb_dataframes:
+        fb_columns = fb_dataframes[0].columns
+        fb_dataframes = [
+            fb_steps_csv_daily
+            if fb_steps_csv_daily.columns.equals(fb_columns)
+            else fb_steps_csv_daily[fb_columns]
+            for fb_steps_csv_daily in fb_dataframes
+        ]
 
     # define the minutes columns, assuming they're the same for all files
     fb_steps_cols = (
@@ -248,26 +361,43 @@ def main():
         if fb_dataframes
         else []
     )
+    # also store their positions, so the steps block can be pulled out as one array with `.iloc` instead of building a new dataframe by label each time
+    fb_steps_idx = (
+        [fb_dataframes[0].columns.get_loc(col) for col in fb_steps_cols]
+        if fb_dataframes
+        else []
+    )
+
+    # each participant's hourly steps (the 60 minute steps columns added up), computed once and reused in 1. and 4.
+    # np.nansum skips blank minutes like pandas .sum() does, instead of losing the whole hour
+    fb_hourly_steps = [
+        np.nansum(fb_steps_csv_daily.iloc[:, fb_steps_idx].to_numpy(), axis=1)
+        for fb_steps_csv_daily in fb_dataframes
+    ]
 
     # 1. daily steps
     print("-------------\n daily steps\n-------------\n")
 
-    daily_steps = []
-
     # iterate through all four daily steps .csv files and sum up number of steps
-    for fb_steps_csv_daily in fb_dataframes:
-        # group by day to calculate daily mean
-        daily_groups = fb_steps_csv_daily.groupby("Date")
-
-        for date, group in daily_groups:
-            day_data = (
-                group[fb_steps_cols].sum().sum()
-            )  # add up the total steps for the day
-            daily_steps.append(day_data)
+    daily_steps_per_participant = []
+    for fb_steps_csv_daily, hourly in zip(fb_dataframes, fb_hourly_steps):
+        # group each hour's steps by day to add up the total steps for each day
+        dates = fb_steps_csv_daily["Date"].to_numpy()
+        day_data = (
+            pd.Series(hourly).groupby(dates, sort=False).sum()
+        )  # the dates are already in order, so skip sorting the groups
+        daily_steps_per_participant.append(day_data.to_numpy(dtype=np.float64))
+
+    # join every participant's daily totals into one float array, so the means below don't need to convert a list
+    daily_steps = (
+        np.concatenate(daily_steps_per_participant)
+        if daily_steps_per_participant
+        else np.empty(0, dtype=np.float64)
+    )
 
     # take both means
-    daily_steps_arith_mean = calculate_mean(daily_steps, use_harmonic=False)
-    daily_steps_harmonic_mean = calculate_mean(daily_steps, use_harmonic=True)
+    daily_steps_arith_mean = _arithmetic_mean(daily_steps)
+    daily_steps_harmonic_mean = _harmonic_mean(daily_steps)
 
     print(f"arith: {daily_steps_arith_mean}")
     print(f"harmonic: {daily_steps_harmonic_mean}")
@@ -276,20 +406,27 @@ def main():
     # 2. group variance
     print("\n----------------\n group variance\n----------------\n")
 
-    # variable to store (sigma, n) for each participant
+    # variable to store (sum of squares, n) for each participant
     participant_stats = []
 
     # iterate through all four participants
     for steps_variance in fb_dataframes:  # reuse daily steps dataframes
-        # calculate this participant's (sigma, n)
-        sigma_i = std_dev(steps_variance[fb_steps_cols])
-        n_i = len(steps_variance[fb_steps_cols].values.flatten().tolist())
-
-        participant_stats.append([sigma_i, n_i])
-
-    # calculate pooled_std_dev() on the collected pairs
-    group_std_dev = pooled_std_dev(participant_stats)
-    group_variance = group_std_dev**2  # variance is pooled standard deviation squared
+        # calculate this participant's (sum of squares, n)
+        steps_i = (
+            steps_variance.iloc[:, fb_steps_idx]
+            .to_numpy(dtype=np.float64, copy=False)
+            .ravel()
+        )  # flatten the minute steps into one array
+        ss_i = _ss_from_mean(steps_i, steps_i.mean())
+        n_i = steps_i.size
+
+        participant_stats.append([ss_i, n_i])
+
+    # calculate pooled_variance_from_ss() on the collected pairs
+    group_variance = pooled_variance_from_ss(participant_stats)
+    group_std_dev = (
+        group_variance**0.5
+    )  # pooled standard deviation is the square root of the variance
 
     print(f"group pooled std dev: {group_std_dev}")
     print(f"group pooled variance: {group_variance}")
@@ -304,72 +441,38 @@ def main():
     fb_data_all = []
     ag_data_all = []
 
+    # the minute offset of each steps column (from the column name), the same for every participant
+    fb_minute_offsets = np.array(
+        [int(col.replace("Steps", "")) for col in fb_steps_cols], dtype="timedelta64[m]"
+    )
+
     # process fitbit steps data
     for fb_steps in fb_dataframes:  # reuse daily steps dataframes
-        # combine the 60 steps columns into one steps list
-        fb_steps_melt = fb_steps.melt(
-            id_vars=["ActivityHour"],
-            value_vars=fb_steps_cols,
-            var_name="Minute",
-            value_name="Steps",
-        )
+        # combine the 60 steps columns into one steps list by flattening hour by hour (no need to melt into a long dataframe)
+        fb_steps_arr = fb_steps.iloc[:, fb_steps_idx].to_numpy()
+        fb_hours = fb_steps["ActivityHour"].to_numpy()
 
-        fb_steps_melt["Minute"] = (
-            fb_steps_melt["Minute"].str.replace("Steps", "").astype(int)
-        )  # convert the 'Minute' column to integers
-
-        fb_steps_melt["datetime"] = fb_steps_melt.apply(
-            lambda row: row["ActivityHour"] + pd.Timedelta(minutes=row["Minute"]),
-            axis=1,
-        )  # turn the steps list dates into `datetime` by adding minutes
+        # turn the steps list dates into `datetime` by adding the minute offsets to each hour
+        fb_datetimes = np.repeat(fb_hours, len(fb_minute_offsets)) + np.tile(
+            fb_minute_offsets, len(fb_hours)
+        )
 
         # format data to be merged later
-        fb_steps_final = fb_steps_melt[["datetime", "Steps"]].set_index("datetime")
+        fb_steps_final = pd.DataFrame(
+            {"Steps": fb_steps_arr.ravel()},
+            index=pd.DatetimeIndex(fb_datetimes, name="datetime"),
+        )
         fb_data_all.append(fb_steps_final)
 
     # process actigraph steps data
-    for i in range(1, 5):
-        # actigraph data comes in two files per participant, so iterate through both
-        for week in range(1, 3):
-            ag_file = (
-                f"sample-data/actigraph-and-fitbit/actigraph/{i}_AG_week{week}.csv"
-            )
-
-            with open(ag_file, "r") as f:
-                header = [
-                    next(f) for _ in range(10)
-                ]  # remove 10 line header on the actigraph files
-
-            # text match in the header to find start time and date
-            ag_start_time_str = (
-                [line for line in header if "Start Time" in line][0]
-                .split(" ")[-1]
-                .strip()
-            )
-            ag_start_date_str = (
-                [line for line in header if "Start Date" in line][0]
-                .split(" ")[-1]
-                .strip()
-            )
-
-            ag_start_datetime = pd.to_datetime(
-                f"{ag_start_date_str} {ag_start_time_str}"
-            )  # combine the time and day into a datetime
-
-            # use pandas to read the steps data
-            ag_steps = pd.read_csv(
-                ag_file,
-                skiprows=10,
-                header=None,
-                usecols=[3],
-                names=["Steps"],
-            )
-
-            # format data to be merged later
-            ag_steps.index = pd.date_range(
-                start=ag_start_datetime, periods=len(ag_steps), freq="min"
-            )
-            ag_data_all.append(ag_steps)
+    # actigraph data comes in two files per participant, and every file is independent, so read them in parallel (pandas releases the GIL while parsing)
+    ag_files = [
+        f"sample-data/actigraph-and-fitbit/actigraph/{i}_AG_week{week}.csv"
+        for i in range(1, 5)
+        for week in range(1, 3)
+    ]
+    with ThreadPoolExecutor(max_workers=len(ag_files)) as executor:
+        ag_data_all.extend(executor.map(read_actigraph_steps, ag_files))
 
     # use pandas to merge the two datasets into one variable with suffixes differentiating them
     fb_data_merged = pd.concat(fb_data_all)
@@ -394,31 +497,35 @@ def main():
     # 4. weekend warriors
     print("\n------------------\n weekend warriors\n------------------\n")
 
+    # reuse each participant's hourly steps, so only the small hourly tables get concatenated
     fb_steps = pd.concat(
-        fb_dataframes, ignore_index=True
+        [
+            pd.DataFrame(
+                {
+                    "Date": fb_steps_csv_daily["Date"].to_numpy(),
+                    "hourly_steps": hourly,
+                }
+            )
+            for fb_steps_csv_daily, hourly in zip(fb_dataframes, fb_hourly_steps)
+        ],
+        ignore_index=True,
     )  # I know that this is a re-used variable
 
-    # seperate the minute steps columns
-    fb_steps["hourly_steps"] = fb_steps[fb_steps_cols].sum(
-        axis=1
-    )  # combine into hourly steps
-
     fb_steps_formatted = (
-        fb_steps.groupby("Date")["hourly_steps"].sum().reset_index()
-    )  # sort by date
+        fb_steps.groupby("Date", sort=False)["hourly_steps"].sum().reset_index()
+    )  # group by date (each participant's dates are already in order, so no need to sort)
     fb_steps_formatted.rename(
         columns={"hourly_steps": "total_daily_steps"}, inplace=True
     )  # reformat hourly --> daily
 
-    fb_steps_formatted["day_of_week"] = pd.to_datetime(
-        fb_steps_formatted["Date"]
-    ).dt.weekday  # add a days column
+    # add a days column (`Date` is already a datetime column, so no need to re-parse it)
+    fb_steps_formatted["day_of_week"] = fb_steps_formatted["Date"].dt.weekday
 
     # Andy from the future here: the f-stat will show that there is a significant difference between days of the week, so I am also taking the averages and outputting them here
     # for the anova(), all four participants are combined, so that's why the output of this average will be in the 20-50k range
     daily_avg_steps = fb_steps_formatted.groupby("day_of_week")[
         "total_daily_steps"
-    ].apply(calculate_mean)  # using harmonic
+    ].mean()  # arithmetic, using pandas' built-in groupby mean
     day_names = [
         "monday",
         "tuesday",
@@ -432,10 +539,13 @@ def main():
     for day_index, avg_steps in daily_avg_steps.items():
         print(f"{day_names[day_index]}: {avg_steps:.2f}")
 
-    # format for anova()
-    fb_steps_anova = fb_steps_formatted.groupby("day_of_week")[
-        "total_daily_steps"
-    ].apply(list)
+    # format for anova(), one array of daily totals per day of the week
+    fb_steps_anova = [
+        day_steps.to_numpy()
+        for _, day_steps in fb_steps_formatted.groupby("day_of_week")[
+            "total_daily_steps"
+        ]
+    ]
 
     # anova() already handles errors, so just directly pass in the data
     f_stat_p4, p_value_p4 = anova(fb_steps_anova)
@@ -460,10 +570,8 @@ def main():
 
     # group by month and year and calculate mean
     multi_monthly_avg_steps = (
-        multi_steps.groupby(["Year", "Month"])["StepTotal"]
-        .agg(
-            calculate_mean
-        )  # this line runs calculate_mean() on each month (arithmetic)
+        multi_steps.groupby(["Year", "Month"], sort=True)["StepTotal"]
+        .mean()  # this line takes the (arithmetic) mean of each month, using pandas' built-in groupby mean instead of calling calculate_mean() per month
         .reset_index()
     )
 